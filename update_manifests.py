@@ -7,38 +7,241 @@ while preserving stable IDs and existing metadata.
 """
 
 import argparse
+import base64
+import fnmatch
 import hashlib
+import http.client
 import json
 import os
+import re
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
-from urllib.request import urlopen
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import ParseResult, unquote, urljoin, urlparse
+from urllib.request import getproxies, proxy_bypass
 
 SCHEMA_VERSION = 1
 
+# Characters read to detect an empty or placeholder manifest file
+PLACEHOLDER_PEEK_SIZE = 64
 
-def compute_sha256(url: str) -> str:
-    """Download file and compute SHA-256 hash."""
-    with urlopen(url) as response:
-        data = response.read()
-        return hashlib.sha256(data).hexdigest()
+# Read size used when streaming downloads through the hasher (Python < 3.11)
+CHUNK_SIZE = 1 << 16
 
+USER_AGENT = "pastiera-dict-manifest-updater"
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
 
-def get_file_size(url: str) -> int:
-    """Get file size from URL without downloading the full file."""
-    with urlopen(url) as response:
-        return int(response.headers.get('Content-Length', 0))
+# Number of assets downloaded and hashed concurrently
+MAX_WORKERS = 8
+
+# Page size used when scanning releases for --tag-pattern
+RELEASES_PER_PAGE = 100
+LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+# Common version suffixes stripped when deriving IDs (e.g., _v1, -v2, .1.0)
+VERSION_SUFFIX_RE = re.compile(r'[-_]v?\d+(\.\d+)*$')
+DOT_NUMBER_SUFFIX_RE = re.compile(r'\.\d+$')
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections per host, reused across all requests of a run."""
+
+    def __init__(self, maxsize: int = 8, headers: Optional[Dict[str, str]] = None, timeout: float = 60):
+        self.maxsize = maxsize
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        # Keyed by (scheme, host, proxy or None)
+        self._idle: Dict[Tuple, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _proxy_for(scheme: str, netloc: str) -> Optional[ParseResult]:
+        # Honour http_proxy/https_proxy/no_proxy like urlopen does
+        proxy = getproxies().get(scheme)
+        if not proxy or proxy_bypass(netloc):
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        return urlparse(proxy)
+
+    @staticmethod
+    def _proxy_headers(proxy: ParseResult) -> Dict[str, str]:
+        if not proxy.username:
+            return {}
+        credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        return {"Proxy-Authorization": f"Basic {base64.b64encode(credentials.encode()).decode()}"}
+
+    def _new_connection(self, scheme: str, netloc: str, proxy: Optional[ParseResult]) -> http.client.HTTPConnection:
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+        
+        proxy_host, proxy_port = proxy.hostname, proxy.port or 80
+        if scheme == "https":
+            # TLS to the origin through a CONNECT tunnel
+            conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout)
+            conn.set_tunnel(netloc, headers=self._proxy_headers(proxy))
+            return conn
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+
+    def _acquire(self, key: Tuple) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _release(self, key: Tuple, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, method: str, url: str, headers: Dict[str, str]):
+        parsed = urlparse(url)
+        proxy = self._proxy_for(parsed.scheme, parsed.netloc)
+        key = (parsed.scheme, parsed.netloc, proxy)
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        if parsed.scheme == "http" and proxy is not None:
+            # Plain HTTP proxies take the absolute URL in the request line
+            path = f"http://{parsed.netloc}{path}"
+            headers = {**headers, **self._proxy_headers(proxy)}
+
+        conn, reused = self._acquire(key)
+        try:
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # Idle connection was dropped by the server - retry once on a fresh one
+            conn = self._new_connection(*key)
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+        return key, conn, response
+
+    def _finish(self, key: Tuple, conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        # A connection can only be reused once its response body is drained
+        if response.isclosed() and not response.will_close:
+            self._release(key, conn)
+        else:
+            conn.close()
+
+    @contextmanager
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None) -> Iterator[http.client.HTTPResponse]:
+        """Issue a request, following redirects, and yield the final response."""
+        request_headers = {**self.headers, **(headers or {})}
+        origin = urlparse(url).netloc
+
+        for _ in range(MAX_REDIRECTS + 1):
+            key, conn, response = self._send(method, url, request_headers)
+            if response.status not in REDIRECT_STATUSES:
+                break
+            location = response.getheader("Location")
+            response.read()
+            self._finish(key, conn, response)
+            if not location:
+                raise HTTPError(url, response.status, "Redirect without Location", response.headers, None)
+            url = urljoin(url, location)
+            if urlparse(url).netloc != origin:
+                # Never forward credentials to the asset CDN
+                request_headers.pop("Authorization", None)
+        else:
+            raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+        try:
+            if response.status >= 300:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+        finally:
+            self._finish(key, conn, response)
+
+
+_HTTP = ConnectionPool(maxsize=MAX_WORKERS, headers={"User-Agent": USER_AGENT})
+
+
+def sha256_uses_openssl() -> bool:
+    """Check hashlib's SHA-256 is OpenSSL-backed (hardware accelerated) rather than the builtin fallback."""
+    return type(hashlib.sha256()).__module__ == "_hashlib"
+
+
+class CountingReader:
+    """Binary file-like wrapper counting the bytes read through it."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self.fileobj.readinto(buffer) or 0
+        self.count += n
+        return n
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.count += len(data)
+        return data
+
+
+def fetch_and_hash(url: str, capture_body: bool = False) -> Tuple[str, int, Optional[bytes]]:
+    """Download file once, returning its SHA-256, size and (with capture_body, for small files) its bytes."""
+    with _HTTP.request("GET", url) as response:
+        if capture_body:
+            content = response.read()
+            return hashlib.sha256(content).hexdigest(), len(content), content
+        
+        # Chunked reads stop silently on a short body, so count what was hashed
+        # and compare it with the advertised length
+        content_length = response.getheader("Content-Length")
+        reader = CountingReader(response)
+        if hasattr(hashlib, "file_digest"):
+            sha256 = hashlib.file_digest(reader, "sha256")
+        else:
+            # Python < 3.11
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: reader.read(CHUNK_SIZE), b''):
+                sha256.update(chunk)
+    if content_length and reader.count != int(content_length):
+        raise IOError(f"Incomplete download of {url}: got {reader.count} of {content_length} bytes")
+    return sha256.hexdigest(), reader.count, None
+
+
+def asset_digest_sha256(asset: Dict) -> Optional[str]:
+    """Return the SHA-256 from a release asset's "digest" field, if GitHub provides one."""
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest.split(":", 1)[1].lower()
+    return None
+
+
+def hash_asset(asset: Dict, capture_body: bool = False) -> Tuple[str, int, Optional[bytes]]:
+    """Download a release asset and compute its SHA-256."""
+    print(f"Computing SHA-256 for {asset['name']}...", file=sys.stderr)
+    return fetch_and_hash(asset["browser_download_url"], capture_body)
 
 
 def derive_id_from_filename(filename: str, extension: str) -> str:
     """Derive stable ID from filename by removing extension and version suffix."""
-    base = filename.replace(extension, '')
+    base = filename.removesuffix(extension)
     # Remove common version patterns (e.g., _v1, -v2, .1.0)
-    import re
-    base = re.sub(r'[-_]v?\d+(\.\d+)*$', '', base)
-    base = re.sub(r'\.\d+$', '', base)
+    base = VERSION_SUFFIX_RE.sub('', base)
+    base = DOT_NUMBER_SUFFIX_RE.sub('', base)
     return base.lower().replace(' ', '_').replace('-', '_')
 
 
@@ -47,9 +250,11 @@ def load_existing_manifest(manifest_path: str) -> Dict:
     if os.path.exists(manifest_path):
         try:
             with open(manifest_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content and content != "hello world":
-                    return json.loads(content)
+                # Only a short file can be an empty/placeholder manifest
+                head = f.read(PLACEHOLDER_PEEK_SIZE)
+                if len(head) == PLACEHOLDER_PEEK_SIZE or head.strip() not in ("", "hello world"):
+                    f.seek(0)
+                    return json.load(f)
         except (json.JSONDecodeError, IOError):
             pass
     
@@ -66,25 +271,45 @@ def load_dicts_metadata(metadata_path: str) -> Dict[str, Dict[str, str]]:
     if os.path.exists(metadata_path):
         try:
             with open(metadata_path, 'r', encoding='utf-8') as f:
-                return json.loads(f.read())
+                return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load dicts metadata: {e}", file=sys.stderr)
     return {}
 
 
-def extract_layout_metadata(url: str) -> tuple[str, str]:
-    """Download and parse layout JSON to extract name and description."""
+def load_release_cache(cache_path: str) -> Dict[str, Dict]:
+    """Load cached GitHub API responses (keyed by URL) used for ETag revalidation."""
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load release cache: {e}", file=sys.stderr)
+    return {}
+
+
+def save_release_cache(cache_path: str, cache: Dict[str, Dict], fetched_urls: List[str]) -> None:
+    """Save cached GitHub API responses for the URLs fetched this run, keeping the cache bounded."""
+    fresh = {url: cache[url] for url in fetched_urls if url in cache}
     try:
-        with urlopen(url) as response:
-            layout_data = json.loads(response.read().decode('utf-8'))
-            name = layout_data.get("name", "")
-            description = layout_data.get("description", "")
-            # Trim description to single line
-            if description:
-                description = description.split('\n')[0].strip()
-            return name, description
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(fresh, f, ensure_ascii=False)
+    except IOError as e:
+        print(f"Warning: Could not save release cache: {e}", file=sys.stderr)
+
+
+def extract_layout_metadata(content: bytes, filename: str) -> tuple[str, str]:
+    """Parse already downloaded layout JSON to extract name and description."""
+    try:
+        layout_data = json.loads(content)
+        name = layout_data.get("name", "")
+        description = layout_data.get("description", "")
+        # Trim description to single line
+        if description:
+            description = description.split('\n')[0].strip()
+        return name, description
     except Exception as e:
-        print(f"Warning: Could not parse layout metadata from {url}: {e}", file=sys.stderr)
+        print(f"Warning: Could not parse layout metadata from {filename}: {e}", file=sys.stderr)
         return "", ""
 
 
@@ -95,20 +320,9 @@ def derive_readable_name_from_id(item_id: str) -> str:
     return ' '.join(word.capitalize() for word in parts)
 
 
-def find_existing_item_by_id(items: List[Dict], item_id: str) -> Optional[Dict]:
-    """Find existing item by ID."""
-    for item in items:
-        if item.get("id") == item_id:
-            return item
-    return None
-
-
-def find_existing_item_by_filename(items: List[Dict], filename: str) -> Optional[Dict]:
-    """Find existing item by filename (for ID preservation)."""
-    for item in items:
-        if item.get("filename") == filename:
-            return item
-    return None
+def utc_timestamp() -> str:
+    """Current UTC time in the manifests' ISO 8601 format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
 def update_manifest(
@@ -117,9 +331,12 @@ def update_manifest(
     release_tag: str,
     assets: List[Dict],
     extension: str,
-    dicts_metadata: Optional[Dict[str, Dict[str, str]]] = None
+    dicts_metadata: Optional[Dict[str, Dict[str, str]]] = None,
+    now_iso: Optional[str] = None
 ) -> None:
     """Update manifest file with new asset information."""
+    # One timestamp shared by generatedAt and every updated item
+    now_iso = now_iso or utc_timestamp()
     existing_manifest = load_existing_manifest(manifest_path)
     existing_items = existing_manifest.get("items", [])
     
@@ -130,11 +347,15 @@ def update_manifest(
             id_by_filename[item["filename"]] = item["id"]
     
     # Start with all existing items as base (preserve items not in this release)
-    # Use dict keyed by ID for efficient lookup and updates
-    updated_items_dict = {item.get("id"): item.copy() for item in existing_items}
+    # Use dict keyed by ID for efficient lookup and updates. Items are updated
+    # in place: the loaded manifest isn't used for anything else.
+    updated_items_dict = {item["id"]: item for item in existing_items if "id" in item}
     processed_ids = set()
+    # Next suffix to try per base ID, so repeated collisions don't rescan from _1
+    next_suffix = {}
     
-    # Process each asset from the current release
+    # Resolve a stable ID for each asset from the current release
+    resolved = []
     for asset in assets:
         filename = asset["name"]
         if not filename.endswith(extension):
@@ -143,37 +364,95 @@ def update_manifest(
         # Derive ID from filename first
         derived_id = derive_id_from_filename(filename, extension)
         
-        # Try to find existing item by derived ID (preferred - stable even if filename changes)
-        existing_item = find_existing_item_by_id(existing_items, derived_id)
-        
-        if existing_item:
+        # Prefer existing item with derived ID (stable even if filename changes)
+        if derived_id in updated_items_dict:
             # Use existing ID (stable)
-            item_id = existing_item.get("id")
+            item_id = derived_id
         else:
-            # Check if filename exists in manifest (backwards compatibility)
-            item_id = id_by_filename.get(filename)
-            if item_id:
-                existing_item = find_existing_item_by_id(existing_items, item_id)
-            else:
-                # New item - use derived ID
-                item_id = derived_id
+            # Check if filename exists in manifest (backwards compatibility),
+            # otherwise it's a new item - use derived ID
+            item_id = id_by_filename.get(filename) or derived_id
         
         # Ensure ID uniqueness within this batch
-        original_id = item_id
-        counter = 1
-        while item_id in processed_ids or (item_id in updated_items_dict and item_id != original_id):
+        if item_id in processed_ids:
+            original_id = item_id
+            counter = next_suffix.get(original_id, 1)
             item_id = f"{original_id}_{counter}"
-            counter += 1
+            while item_id in processed_ids or item_id in updated_items_dict:
+                counter += 1
+                item_id = f"{original_id}_{counter}"
+            next_suffix[original_id] = counter + 1
         
         processed_ids.add(item_id)
+        resolved.append((asset, item_id))
+    
+    # Trust the SHA-256 digest GitHub reports for release assets when present,
+    # ahead of any stored hash. Layouts are still downloaded since their
+    # name/description come from the file.
+    capture_body = asset_type == "layout"
+    digest_sha256 = {}
+    if not capture_body:
+        for asset, item_id in resolved:
+            digest = asset_digest_sha256(asset)
+            if digest:
+                digest_sha256[item_id] = digest
+    
+    # Re-running the same release: reuse stored hashes of unchanged assets.
+    # A GitHub digest, when present, must match too (size alone misses re-uploads).
+    cached_sha256 = {}
+    if existing_manifest.get("releaseTag") == release_tag:
+        for asset, item_id in resolved:
+            if item_id in digest_sha256:
+                continue
+            item = updated_items_dict.get(item_id)
+            digest = asset_digest_sha256(asset)
+            if (item and item.get("sha256")
+                    and item.get("url") == asset["browser_download_url"]
+                    and item.get("bytes") == asset["size"]
+                    and (digest is None or digest == item["sha256"])):
+                cached_sha256[item_id] = item["sha256"]
+    
+    # Download and hash remaining assets concurrently (I/O bound); results are
+    # applied below in release order. Layouts are parsed from the same download.
+    to_fetch = [
+        (asset, item_id) for asset, item_id in resolved
+        if item_id not in cached_sha256 and item_id not in digest_sha256
+    ]
+    downloads = {}
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {executor.submit(hash_asset, asset, capture_body): item_id for asset, item_id in to_fetch}
+        for future in as_completed(futures):
+            downloads[futures[future]] = future.result()
+    finally:
+        # On the first failure, drop queued downloads instead of fetching them all
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Process each asset from the current release
+    for asset, item_id in resolved:
+        filename = asset["name"]
         
-        # Get asset metadata
+        # Get asset metadata (size from the release API is authoritative)
         download_url = asset["browser_download_url"]
         file_size = asset["size"]
         
-        # Compute SHA-256 (GitHub API doesn't provide it)
-        print(f"Computing SHA-256 for {filename}...", file=sys.stderr)
-        sha256 = compute_sha256(download_url)
+        is_cached = item_id in cached_sha256
+        if item_id in digest_sha256:
+            print(f"Using GitHub digest as SHA-256 for {filename}", file=sys.stderr)
+            sha256, content = digest_sha256[item_id], None
+        elif is_cached:
+            print(f"Reusing SHA-256 for unchanged {filename}", file=sys.stderr)
+            sha256, content = cached_sha256[item_id], None
+        else:
+            sha256, downloaded_size, content = downloads[item_id]
+            if downloaded_size != file_size:
+                # Never publish a hash of bytes clients won't receive
+                print(f"Error: {filename} downloaded {downloaded_size} bytes but release reports {file_size}", file=sys.stderr)
+                sys.exit(1)
+            digest = asset_digest_sha256(asset)
+            if digest and digest != sha256:
+                print(f"Error: {filename} SHA-256 {sha256} doesn't match GitHub digest {digest}", file=sys.stderr)
+                sys.exit(1)
         
         # Check if this is an update to an existing item or a new item
         is_update = item_id in updated_items_dict
@@ -186,7 +465,7 @@ def update_manifest(
             item["url"] = download_url
             item["bytes"] = file_size
             item["sha256"] = sha256
-            item["updatedAt"] = datetime.utcnow().isoformat() + "Z"
+            item["updatedAt"] = now_iso
             # Update filename if changed
             if "filename" not in item or item["filename"] != filename:
                 item["filename"] = filename
@@ -199,16 +478,18 @@ def update_manifest(
                 "url": download_url,
                 "bytes": file_size,
                 "sha256": sha256,
-                "updatedAt": datetime.utcnow().isoformat() + "Z"
+                "updatedAt": now_iso
             }
             updated_items_dict[item_id] = item
         
         # Add/update UI-friendly fields based on asset type
         if asset_type == "layout":
-            # Parse layout JSON to extract name and description
-            layout_name, layout_description = extract_layout_metadata(download_url)
-            item["name"] = layout_name
-            item["shortDescription"] = layout_description
+            # Parse name and description from the bytes that were just hashed
+            # (unchanged layouts keep the values extracted last time)
+            if not is_cached:
+                layout_name, layout_description = extract_layout_metadata(content, filename)
+                item["name"] = layout_name
+                item["shortDescription"] = layout_description
             if "languageTag" not in item:
                 item["languageTag"] = ""
         elif asset_type == "dictionary":
@@ -229,14 +510,14 @@ def update_manifest(
                 if not is_update:  # Only warn for new items, not updates
                     print(f"Warning: Missing metadata for dictionary '{item_id}'. Please add it to dicts-metadata.json", file=sys.stderr)
     
-    # Convert dict to list and sort by ID for stable ordering
-    updated_items_list = list(updated_items_dict.values())
-    updated_items_list.sort(key=lambda x: x.get("id", ""))
+    # Convert dict to list sorted by ID for stable ordering (sorting the keys
+    # avoids a key function call per item)
+    updated_items_list = [updated_items_dict[item_id] for item_id in sorted(updated_items_dict)]
     
     # Build final manifest
     manifest = {
         "schemaVersion": SCHEMA_VERSION,
-        "generatedAt": datetime.utcnow().isoformat() + "Z",
+        "generatedAt": now_iso,
         "releaseTag": release_tag,
         "items": updated_items_list
     }
@@ -244,44 +525,81 @@ def update_manifest(
     # Ensure directory exists
     os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
     
-    # Write manifest
-    with open(manifest_path, 'w', encoding='utf-8') as f:
+    # Write manifest to a temp file and swap it in, so a crash never leaves
+    # a partially written manifest behind
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
     
     print(f"Updated {manifest_path} with {len(updated_items_list)} {asset_type} items", file=sys.stderr)
 
 
-def fetch_release_assets(owner: str, repo: str, release_tag: Optional[str] = None, tag_pattern: Optional[str] = None) -> tuple[str, List[Dict]]:
-    """Fetch release assets from GitHub API."""
-    import urllib.request
-    import base64
-    import re
+def github_api_headers() -> Dict[str, str]:
+    """Build GitHub API request headers, with authentication if a token is provided."""
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        auth = base64.b64encode(f":{token}".encode()).decode()
+        headers["Authorization"] = f"Basic {auth}"
+    return headers
+
+
+def fetch_github_json(url: str, headers: Dict[str, str], cache: Dict[str, Dict]) -> Tuple[object, Optional[str]]:
+    """GET GitHub API JSON and next page URL, answering 304 Not Modified from the ETag cache."""
+    cached = cache.get(url)
+    if cached and cached.get("etag"):
+        headers = {**headers, "If-None-Match": cached["etag"]}
+    
+    try:
+        with _HTTP.request("GET", url, headers) as response:
+            data = json.loads(response.read().decode('utf-8'))
+            etag = response.getheader("ETag")
+            link = LINK_NEXT_RE.search(response.getheader("Link", ""))
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            return cached["data"], cached.get("next")
+        raise
+    
+    next_url = link.group(1) if link else None
+    if etag:
+        cache[url] = {"etag": etag, "data": data, "next": next_url}
+    return data, next_url
+
+
+def fetch_release_assets(
+    owner: str,
+    repo: str,
+    release_tag: Optional[str] = None,
+    tag_pattern: Optional[str] = None,
+    cache_path: Optional[str] = None
+) -> tuple[str, List[Dict]]:
+    """Fetch release assets from GitHub API, reusing cached responses when unchanged."""
+    headers = github_api_headers()
+    cache = load_release_cache(cache_path) if cache_path else {}
+    fetched_urls = []
     
     # Build API URL
     if release_tag:
         url = f"https://api.github.com/repos/{owner}/{repo}/releases/tags/{release_tag}"
     elif tag_pattern:
-        # Fetch all releases and find the latest matching the pattern
-        url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-        request = urllib.request.Request(url)
-        request.add_header("Accept", "application/vnd.github.v3+json")
-        
-        token = os.environ.get("GITHUB_TOKEN")
-        if token:
-            auth = base64.b64encode(f":{token}".encode()).decode()
-            request.add_header("Authorization", f"Basic {auth}")
+        # Page through releases (newest first) and stop at the first matching the pattern
+        url = f"https://api.github.com/repos/{owner}/{repo}/releases?per_page={RELEASES_PER_PAGE}"
+        pattern = re.compile(fnmatch.translate(tag_pattern))
         
         try:
-            with urlopen(request) as response:
-                releases = json.loads(response.read().decode('utf-8'))
-                pattern = re.compile(tag_pattern.replace('*', '.*'))
+            while url:
+                fetched_urls.append(url)
+                releases, url = fetch_github_json(url, headers, cache)
                 for release in releases:
                     if pattern.match(release["tag_name"]):
                         release_tag = release["tag_name"]
                         assets = release.get("assets", [])
+                        if cache_path:
+                            save_release_cache(cache_path, cache, fetched_urls)
                         return release_tag, assets
-                print(f"No release found matching pattern: {tag_pattern}", file=sys.stderr)
-                sys.exit(1)
+            print(f"No release found matching pattern: {tag_pattern}", file=sys.stderr)
+            sys.exit(1)
         except Exception as e:
             print(f"Error fetching releases: {e}", file=sys.stderr)
             sys.exit(1)
@@ -289,21 +607,14 @@ def fetch_release_assets(owner: str, repo: str, release_tag: Optional[str] = Non
         url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
     
     # Make request
-    request = urllib.request.Request(url)
-    request.add_header("Accept", "application/vnd.github.v3+json")
-    
-    # Add authentication if token is provided
-    token = os.environ.get("GITHUB_TOKEN")
-    if token:
-        auth = base64.b64encode(f":{token}".encode()).decode()
-        request.add_header("Authorization", f"Basic {auth}")
-    
     try:
-        with urlopen(request) as response:
-            release_data = json.loads(response.read().decode('utf-8'))
-            release_tag = release_data["tag_name"]
-            assets = release_data.get("assets", [])
-            return release_tag, assets
+        fetched_urls.append(url)
+        release_data, _ = fetch_github_json(url, headers, cache)
+        release_tag = release_data["tag_name"]
+        assets = release_data.get("assets", [])
+        if cache_path:
+            save_release_cache(cache_path, cache, fetched_urls)
+        return release_tag, assets
     except Exception as e:
         print(f"Error fetching release: {e}", file=sys.stderr)
         sys.exit(1)
@@ -348,23 +659,40 @@ def main():
         help="Path to dictionaries metadata mapping file"
     )
     
+    parser.add_argument(
+        "--release-cache",
+        default=".release-cache.json",
+        help="Path to cache of GitHub API responses used for conditional requests"
+    )
+    
     args = parser.parse_args()
     
+    if not sha256_uses_openssl():
+        print("Warning: Python's hashlib isn't using OpenSSL; SHA-256 hashing will be slow", file=sys.stderr)
+    
     # Load dictionary metadata if it exists
     dicts_metadata = None
     if os.path.exists(args.dicts_metadata):
         dicts_metadata = load_dicts_metadata(args.dicts_metadata)
     
     # Fetch release assets
-    release_tag, assets = fetch_release_assets(args.owner, args.repo, args.release_tag, args.tag_pattern)
+    release_tag, assets = fetch_release_assets(
+        args.owner, args.repo, args.release_tag, args.tag_pattern, args.release_cache
+    )
     print(f"Processing release: {release_tag}", file=sys.stderr)
     print(f"Found {len(assets)} assets", file=sys.stderr)
     
-    # Separate dictionaries and layouts
-    dict_assets = [a for a in assets if a["name"].endswith(".dict")]
-    layout_assets = [a for a in assets if a["name"].endswith(".json")]
+    # Separate dictionaries and layouts in a single pass
+    dict_assets, layout_assets = [], []
+    for asset in assets:
+        name = asset["name"]
+        if name.endswith(".dict"):
+            dict_assets.append(asset)
+        elif name.endswith(".json"):
+            layout_assets.append(asset)
     
-    # Update manifests
+    # Update manifests, stamped with the same time
+    now_iso = utc_timestamp()
     if dict_assets:
         update_manifest(
             args.dicts_manifest,
@@ -372,7 +700,8 @@ def main():
             release_tag,
             dict_assets,
             ".dict",
-            dicts_metadata
+            dicts_metadata,
+            now_iso
         )
     else:
         print("No dictionary assets found", file=sys.stderr)
@@ -384,7 +713,8 @@ def main():
             release_tag,
             layout_assets,
             ".json",
-            None
+            None,
+            now_iso
         )
     else:
         print("No layout assets found", file=sys.stderr)